@@ -1,35 +1,199 @@
-import numpy as np
+import math
+from functools import lru_cache, partial
+
 import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider, RadioButtons
-from scipy import stats
+import numpy as np
+from matplotlib.widgets import RadioButtons, Slider
+from scipy.special import ndtr, ndtri, stdtr, stdtrit
+
+# Delay before a burst of slider events is redrawn
+DEBOUNCE_MS = 40
+
+# Visible x range and the largest effect the slider allows
+X_MIN, X_MAX = -4.0, 8.0
+EFFECT_MAX = 5.0
+
+# Grid resolutions: coarse while a slider is dragged, fine once it settles
+GRID_POINTS_FINE = 1000
+GRID_POINTS_COARSE = 200
+
+_INV_SQRT_2PI = 1 / math.sqrt(2 * math.pi)
+
+# Last computed curves and critical value per grid, reused across slider events
+_pdf_cache = {}
+
+
+def norm_pdf(x, shift, out):
+    """Standard normal density of x - shift, written into out."""
+    np.subtract(x, shift, out=out)
+    np.multiply(out, out, out=out)
+    out *= -0.5
+    np.exp(out, out=out)
+    out *= _INV_SQRT_2PI
+    return out
+
+
+def t_pdf(x, shift, out, df):
+    """Student's t density of x - shift with df degrees, written into out."""
+    log_norm = (
+        math.lgamma((df + 1) / 2) - math.lgamma(df / 2)
+        - 0.5 * math.log(df * math.pi)
+    )
+    np.subtract(x, shift, out=out)
+    np.multiply(out, out, out=out)
+    out /= df
+    np.log1p(out, out=out)
+    out *= -(df + 1) / 2
+    out += log_norm
+    np.exp(out, out=out)
+    return out
+
+
+@lru_cache(maxsize=128)
+def dist_functions(df):
+    """
+    Return (pdf, cdf, ppf) for Z (df=None) or Student's t with df degrees.
+
+    pdf(x, shift, out) evaluates the density in place with NumPy ufuncs; the
+    scalar cdf/ppf calls go straight to the scipy.special routines
+    (ndtr/ndtri, stdtr/stdtrit) that scipy.stats wraps. The t callables have
+    df bound once per N, so alpha and effect moves reuse them.
+    """
+    if df is None:
+        return norm_pdf, ndtr, ndtri
+    return (
+        partial(t_pdf, df=df),
+        partial(stdtr, df),
+        partial(stdtrit, df),
+    )
+
+
+def compute_pdfs_and_crit(x, n, alpha, effect, is_two_sided, is_z):
+    """
+    Evaluate the H0 density on the x grid, the H1 x positions, critical
+    value and beta.
+
+    H1 is H0 shifted by the effect, so its curve is the H0 density drawn at
+    x + effect: only one density is ever evaluated, and x must cover
+    [X_MIN - EFFECT_MAX, X_MAX] so both curves span the visible range.
+
+    All numeric work for one slider event happens in this single call so the
+    callback only deals with artists. Results are only recomputed when their
+    inputs change: moving alpha or the effect evaluates no density, and N is
+    irrelevant for the Z distribution. Each grid resolution keeps its own
+    entry so alternating between the drag and settled grids does not evict
+    the other, and its buffers are rewritten in place, so a slider event
+    allocates no new arrays.
+
+    Returns:
+        Tuple (y, x_h1, crit_val, beta_prob, h0_stamp, h1_stamp): H0 is
+        (x, y) and H1 is (x_h1, y). The stamps identify what the buffers
+        currently hold, so callers can tell when they were rewritten.
+    """
+    df = None if is_z else max(1, n - 1)
+    pdf, cdf, ppf = dist_functions(df)
+    cache = _pdf_cache.get(x.size)
+    if cache is None:
+        cache = _pdf_cache[x.size] = {
+            'y': np.empty_like(x),
+            'x_h1': np.empty_like(x),
+        }
+
+    key_h0 = (x.size, df)
+    if cache.get('h0_key') != key_h0:
+        cache['h0_key'] = key_h0
+        pdf(x, 0.0, cache['y'])
+
+    key_h1 = (x.size, df, effect)
+    if cache.get('h1_key') != key_h1:
+        cache['h1_key'] = key_h1
+        np.add(x, effect, out=cache['x_h1'])
+
+    key_crit = (df, alpha, is_two_sided)
+    if cache.get('crit_key') != key_crit:
+        alpha_tail = alpha / 2 if is_two_sided else alpha
+        cache['crit_key'] = key_crit
+        cache['crit_val'] = ppf(1 - alpha_tail)
+
+    crit_val = cache['crit_val']
+
+    # Beta stays on the exact cdf: integrating the plotted curves would drop
+    # the tail mass outside the x range (several percent for small df).
+    if is_two_sided:
+        # Power = P(reject) = P(X > crit) + P(X < -crit) | H1
+        # Usually P(X < -crit) is negligible for positive effect size, but formally exists.
+        # Both tails are evaluated in a single vectorised cdf call.
+        lower, upper = cdf(np.array([-crit_val, crit_val]) - effect)
+        beta_prob = upper - lower
+    else:
+        beta_prob = cdf(crit_val - effect)
+
+    return cache['y'], cache['x_h1'], crit_val, beta_prob, key_h0, key_h1
+
+
+def region_verts(out, x_seg, y_seg):
+    """
+    Write the closed polygon between the x axis and y_seg into out.
+
+    out is a preallocated (>= 2 * len(x_seg), 2) float64 buffer; the filled
+    view is returned. Matplotlib upcasts vertices to float64 and copies them
+    when closing the path, so the buffer can be reused on the next event.
+    """
+    m = x_seg.size
+    verts = out[:2 * m]
+    verts[:m, 0] = x_seg
+    verts[:m, 1] = 0.0
+    verts[m:, 0] = x_seg[::-1]
+    verts[m:, 1] = y_seg[::-1]
+    return verts
+
+
+def set_fill(fill, buffers, x, y, *spans):
+    """Point a fill at the (start, stop) index span(s) of (x, y)."""
+    verts = []
+    for buf, (start, stop) in zip(buffers, spans):
+        if stop > start:
+            verts.append(region_verts(buf, x[start:stop], y[start:stop]))
+    fill.set_verts(verts)
+
 
 def plot_interactive_alpha_beta():
     # Initial Parameters
     init_n = 30
     init_alpha = 0.05
     init_effect = 2.5  # Distance between H0 and H1 peaks
-    
+
     # Create the figure
     fig, ax = plt.subplots(figsize=(12, 7))
     plt.subplots_adjust(left=0.1, bottom=0.35, right=0.9, top=0.9)
-    
-    # X-axis range
-    x = np.linspace(-4, 8, 1000)
-    
+
+    # Density grids: wide enough on the left for H1 at the largest effect
+    x_fine = np.linspace(X_MIN - EFFECT_MAX, X_MAX, GRID_POINTS_FINE)
+    x_coarse = np.linspace(X_MIN - EFFECT_MAX, X_MAX, GRID_POINTS_COARSE)
+    x = x_fine
+
     # Elements to be updated (Updated labels)
     line_h0, = ax.plot(x, np.zeros_like(x), label='Noise (H0)', color='blue', lw=2)
     line_h1, = ax.plot(x, np.zeros_like(x), label='Real Effect (H1)', color='orange', lw=2)
-    
+
     # Critical lines (Right and Left)
     crit_line_r = ax.axvline(x=0, color='red', linestyle='--', label='Threshold (+)')
     crit_line_l = ax.axvline(x=0, color='red', linestyle='--', alpha=0, label='Threshold (-)') # Hidden by default
-    
-    fill_alpha_r = ax.fill_between(x, 0, 0, color='red', alpha=0.3)
-    fill_alpha_l = ax.fill_between(x, 0, 0, color='red', alpha=0.3)
-    fill_beta = ax.fill_between(x, 0, 0, color='gray', alpha=0.3)
+
+    # Fills are created once; update() only swaps their vertices
+    fill_alpha_r = ax.fill_between(x, 0, 0, color='red', alpha=0.5)
+    fill_alpha_l = ax.fill_between(x, 0, 0, color='red', alpha=0.5)
+    fill_beta = ax.fill_between(x, 0, 0, color='gray', alpha=0.5)
     # Add fill for Power (Green)
-    fill_power = ax.fill_between(x, 0, 0, color='green', alpha=0.2)
-    
+    fill_power = ax.fill_between(x, 0, 0, color='green', alpha=0.3)
+
+    # Vertex buffers, one per polygon a fill can hold (two-sided power has
+    # two), sized for the fine grid and rewritten in place on every event
+    fill_buffers = {
+        fill: np.empty((2, 2 * GRID_POINTS_FINE, 2))
+        for fill in (fill_alpha_r, fill_alpha_l, fill_beta, fill_power)
+    }
+
     # Text annotations - fixed positions relative to axes or dynamic
     txt_alpha = ax.text(0.95, 0.80, '', transform=ax.transAxes, color='red', fontsize=10, ha='right')
     txt_beta = ax.text(0.05, 0.80, '', transform=ax.transAxes, color='gray', fontsize=10, ha='left')
@@ -37,10 +201,10 @@ def plot_interactive_alpha_beta():
     title_text = ax.text(0.5, 1.05, '', transform=ax.transAxes, ha='center', fontsize=12, fontweight='bold')
 
     ax.set_ylim(0, 0.55)
-    ax.set_xlim(-4, 8)
+    ax.set_xlim(X_MIN, X_MAX)
     ax.legend(loc='upper center', bbox_to_anchor=(0.5, 1.0), ncol=3, fontsize='small')
     ax.grid(True, alpha=0.2)
-    
+
     # Add static helper labels on the plot
     ax.text(0, 0.02, "Safe Zone\n(Keep H0)", color='blue', alpha=0.5, ha='center', fontsize=9)
     ax.text(5, 0.02, "Success Zone\n(Reject H0)", color='green', alpha=0.5, ha='center', fontsize=9)
@@ -49,12 +213,12 @@ def plot_interactive_alpha_beta():
     ax_n = plt.axes([0.15, 0.25, 0.65, 0.03])
     ax_alpha = plt.axes([0.15, 0.20, 0.65, 0.03])
     ax_eff = plt.axes([0.15, 0.15, 0.65, 0.03])
-    
+
     # Sliders
     s_n = Slider(ax_n, 'Sample Size (N)', 2, 1000, valinit=init_n, valstep=1)
     s_alpha = Slider(ax_alpha, 'Alpha (False Alarm)', 0.01, 0.20, valinit=init_alpha, valstep=0.001)
-    s_eff = Slider(ax_eff, 'Effect Size (Signal)', 0.0, 5.0, valinit=init_effect)
-    
+    s_eff = Slider(ax_eff, 'Effect Size (Signal)', 0.0, EFFECT_MAX, valinit=init_effect)
+
     # Radio buttons for distribution type
     ax_radio_dist = plt.axes([0.85, 0.15, 0.12, 0.12])
     radio_dist = RadioButtons(ax_radio_dist, ('T-Dist', 'Z-Dist'))
@@ -63,118 +227,197 @@ def plot_interactive_alpha_beta():
     ax_radio_sides = plt.axes([0.85, 0.02, 0.12, 0.12])
     radio_sides = RadioButtons(ax_radio_sides, ('1-Sided', '2-Sided'))
 
-    def update(val):
+    # What the artists currently show, so unchanged data is not pushed again
+    shown = {'args': None, 'x': x, 'h0': None, 'h1': None, 'crit_val': None}
+
+    # Blitting: everything that changes per event is animated and drawn over
+    # a cached background, so grid, ticks, legend and static labels are not
+    # repainted. The slider axes are animated as well (their labels and knob
+    # reach outside the axes) and must not request a full redraw themselves.
+    dynamic_artists = (
+        fill_alpha_r, fill_alpha_l, fill_beta, fill_power,
+        line_h0, line_h1, crit_line_r, crit_line_l,
+        txt_alpha, txt_beta, txt_power, title_text,
+    )
+    for art in dynamic_artists:
+        art.set_animated(True)
+
+    sliders = (s_n, s_alpha, s_eff)
+    for slider in sliders:
+        slider.drawon = False
+        slider.ax.set_animated(True)
+
+    blit = {'background': None}
+
+    def draw_dynamic(renderer):
+        for art in dynamic_artists:
+            art.draw(renderer)
+
+    def draw_sliders(renderer):
+        for slider in sliders:
+            slider.ax.draw(renderer)
+
+    def on_draw(event):
+        # Every full draw (first show, resize, radio click) refreshes the
+        # background and puts the animated artists back on top of it.
+        # While saving, the main axes already render their animated artists.
+        if not event.canvas.is_saving():
+            if event.canvas.supports_blit:
+                blit['background'] = event.canvas.copy_from_bbox(fig.bbox)
+            draw_dynamic(event.renderer)
+        draw_sliders(event.renderer)
+
+    fig.canvas.mpl_connect('draw_event', on_draw)
+
+    # Sides-specific drawing: the threshold markers, shaded regions and alpha
+    # label differ between one- and two-sided tests, so each case gets its
+    # own straight-line function and the radio button swaps which one runs.
+    # All regions are contiguous index spans of the sorted, fixed grid:
+    # i_l / i_r are the thresholds on the H0 positions x, j_l / j_r the same
+    # thresholds on the shifted H1 positions x + effect.
+    def shade_one_sided(x, y, x_h1, crit_val, effect, alpha):
+        end = x.size
+        i_r = np.searchsorted(x, crit_val, side='left')
+        j_r = np.searchsorted(x, crit_val - effect, side='left')
+
+        crit_line_l.set_alpha(0) # Hide it
+
+        # 1. Alpha (False Positive), right tail only
+        set_fill(fill_alpha_r, fill_buffers[fill_alpha_r], x, y, (i_r, end))
+        set_fill(fill_alpha_l, fill_buffers[fill_alpha_l], x, y)
+
+        # 2. Beta (Missed): H1 left of the threshold
+        set_fill(fill_beta, fill_buffers[fill_beta], x_h1, y, (0, j_r))
+
+        # 3. Power (Success): H1 right of the threshold
+        set_fill(fill_power, fill_buffers[fill_power], x_h1, y, (j_r, end))
+
+        txt_alpha.set_text(f"Alpha: {alpha:.1%}\nThreshold: {crit_val:.2f}")
+
+    def shade_two_sided(x, y, x_h1, crit_val, effect, alpha):
+        # Split alpha into two tails
+        crit_val_l = -crit_val
+        end = x.size
+        i_r = np.searchsorted(x, crit_val, side='left')
+        i_l = np.searchsorted(x, crit_val_l, side='right')
+        j_r = np.searchsorted(x, crit_val - effect, side='left')
+        j_l = np.searchsorted(x, crit_val_l - effect, side='right')
+
+        crit_line_l.set_xdata([crit_val_l, crit_val_l])
+        crit_line_l.set_alpha(1) # Show it
+
+        # 1. Alpha Right and Left (False Positive)
+        set_fill(fill_alpha_r, fill_buffers[fill_alpha_r], x, y, (i_r, end))
+        set_fill(fill_alpha_l, fill_buffers[fill_alpha_l], x, y, (0, i_l))
+
+        # 2. Beta (Missed): H1 falls in the "Safe Zone" between the thresholds
+        set_fill(fill_beta, fill_buffers[fill_beta], x_h1, y, (j_l, j_r))
+
+        # 3. Power (Success): H1 falls in either rejection region
+        set_fill(fill_power, fill_buffers[fill_power], x_h1, y, (0, j_l), (j_r, end))
+
+        txt_alpha.set_text(f"Alpha/2: {alpha/2:.1%}\nThreshold: ±{crit_val:.2f}")
+
+    shade_for_sides = {'1-Sided': shade_one_sided, '2-Sided': shade_two_sided}
+    current = {'shade': shade_for_sides[radio_sides.value_selected]}
+
+    def real_update(x=x_fine):
         n = int(s_n.val)
         alpha = s_alpha.val
         effect = s_eff.val
         dist_type = radio_dist.value_selected
         sides_type = radio_sides.value_selected
-        
+
+        # Sliders re-fire with the same (or float-jittered) value; nothing to
+        # do unless an input or the grid actually changed. Rounding matches
+        # the precision the labels display.
+        args = (x.size, n, round(alpha, 4), round(effect, 4), dist_type, sides_type)
+        if args == shown['args']:
+            return
+        shown['args'] = args
+
         is_two_sided = (sides_type == '2-Sided')
 
         # Determine distribution
-        if dist_type == 'Z-Dist':
-            dist = stats.norm
+        is_z = (dist_type == 'Z-Dist')
+        if is_z:
             dist_name = "Z (Normal)"
         else:
-            df = max(1, n - 1)
-            dist = stats.t(df)
-            dist_name = f"T (Student, df={df})"
-
-        # Critical Value Calculations
-        if is_two_sided:
-            # Split alpha into two tails
-            crit_val = dist.ppf(1 - alpha / 2)
-            crit_val_l = -crit_val
-            alpha_label = f"Alpha/2: {alpha/2:.1%}"
-        else:
-            # One tail
-            crit_val = dist.ppf(1 - alpha)
-            crit_val_l = -999 # Far away
-            alpha_label = f"Alpha: {alpha:.1%}"
-        
-        # H0 & H1 PDFs
-        y_h0 = dist.pdf(x)
-        y_h1 = dist.pdf(x - effect)
-        
+            dist_name = f"T (Student, df={max(1, n - 1)})"
+
+        # H0 & H1 PDFs, critical value and beta in one call
+        y, x_h1, crit_val, beta_prob, h0_stamp, h1_stamp = compute_pdfs_and_crit(
+            x, n, alpha, effect, is_two_sided, is_z
+        )
+
         # Update lines
-        line_h0.set_ydata(y_h0)
-        line_h1.set_ydata(y_h1)
-        
-        crit_line_r.set_xdata([crit_val, crit_val])
-        
-        if is_two_sided:
-            crit_line_l.set_xdata([crit_val_l, crit_val_l])
-            crit_line_l.set_alpha(1) # Show it
-        else:
-            crit_line_l.set_alpha(0) # Hide it
-        
-        # Calculates Areas/Fills
-        nonlocal fill_alpha_r, fill_alpha_l, fill_beta, fill_power
-        fill_alpha_r.remove()
-        fill_alpha_l.remove()
-        fill_beta.remove()
-        fill_power.remove()
-        
-        # 1. Alpha Right (False Positive)
-        mask_alpha_r = x >= crit_val
-        fill_alpha_r = ax.fill_between(x, 0, y_h0, where=mask_alpha_r, color='red', alpha=0.5, label='Alpha R')
-        
-        # 2. Alpha Left (False Positive - Only for 2-sided)
-        if is_two_sided:
-            mask_alpha_l = x <= crit_val_l
-            fill_alpha_l = ax.fill_between(x, 0, y_h0, where=mask_alpha_l, color='red', alpha=0.5, label='Alpha L')
-        else:
-            # Create empty fill
-            fill_alpha_l = ax.fill_between(x, 0, 0, color='red', alpha=0.0)
-
-        # 3. Beta (Missed): H1 falls in the "Safe Zone" (Acceptance Region)
-        # Safe zone is everything between left_crit and right_crit.
-        # For 1-sided, left_crit is effectively -infinity.
-        if is_two_sided:
-            mask_beta = (x > crit_val_l) & (x < crit_val)
-        else:
-            mask_beta = x < crit_val
-            
-        fill_beta = ax.fill_between(x, 0, y_h1, where=mask_beta, color='gray', alpha=0.5, label='Beta')
-        
-        # 4. Power (Success): H1 falls in Rejection Regions
-        if is_two_sided:
-            mask_power = (x <= crit_val_l) | (x >= crit_val)
-        else:
-            mask_power = x >= crit_val
-            
-        fill_power = ax.fill_between(x, 0, y_h1, where=mask_power, color='green', alpha=0.3, label='Power')
-
-        # Calculate logical values
-        if is_two_sided:
-            # Power = P(reject) = P(X > crit) + P(X < -crit) | H1
-            # Usually P(X < -crit) is negligible for positive effect size, but formally exists.
-            beta_prob = dist.cdf(crit_val - effect) - dist.cdf(crit_val_l - effect)
-        else:
-            beta_prob = dist.cdf(crit_val - effect)
-            
+        if h0_stamp != shown['h0']:
+            line_h0.set_data(x, y)
+            shown['h0'] = h0_stamp
+        if (h0_stamp, h1_stamp) != shown['h1']:
+            line_h1.set_data(x_h1, y)
+            shown['h1'] = (h0_stamp, h1_stamp)
+        shown['x'] = x
+
+        if crit_val != shown['crit_val']:
+            crit_line_r.set_xdata([crit_val, crit_val])
+            shown['crit_val'] = crit_val
+
+        # Threshold markers, Areas/Fills and alpha label
+        current['shade'](x, y, x_h1, crit_val, effect, alpha)
+
         power_prob = 1 - beta_prob
-        
+
         # Update Texts
-        txt_alpha.set_text(f"{alpha_label}\nThreshold: ±{crit_val:.2f}" if is_two_sided else f"{alpha_label}\nThreshold: {crit_val:.2f}")
         txt_beta.set_text(f"Beta (Missed): {beta_prob:.1%}")
         txt_power.set_text(f"Power (Success): {power_prob:.1%}")
-        
+
         side_text = "2-Sided" if is_two_sided else "1-Sided"
         title_text.set_text(f"{dist_name} | {side_text} | N={n}")
-        
-        fig.canvas.draw_idle()
+
+        canvas = fig.canvas
+        if blit['background'] is None:
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(blit['background'])
+            renderer = canvas.get_renderer()
+            draw_dynamic(renderer)
+            draw_sliders(renderer)
+            canvas.blit(fig.bbox)
+
+    # Sliders fire on every pixel of a drag: each event is drawn on the
+    # coarse grid, and the fine grid is drawn once DEBOUNCE_MS after the
+    # last change (or as soon as the mouse button is released).
+    timer = fig.canvas.new_timer(interval=DEBOUNCE_MS)
+    timer.single_shot = True
+    timer.add_callback(real_update)
+
+    def update(val):
+        real_update(x_coarse)
+        timer.stop()
+        timer.start()
+
+    def on_release(event):
+        if shown['x'] is x_coarse:
+            timer.stop()
+            real_update()
+
+    fig.canvas.mpl_connect('button_release_event', on_release)
 
     s_n.on_changed(update)
     s_alpha.on_changed(update)
     s_eff.on_changed(update)
-    radio_dist.on_clicked(update)
-    radio_sides.on_clicked(update)
-    
+    radio_dist.on_clicked(lambda label: real_update())
+
+    def on_sides(label):
+        current['shade'] = shade_for_sides[label]
+        real_update()
+
+    radio_sides.on_clicked(on_sides)
+
     # Run first update
-    update(None)
-    
+    real_update()
+
     plt.show()
 
 if __name__ == "__main__":
@@ -186,7 +429,7 @@ if __name__ == "__main__":
     print("   -> Watch how T-distribution gets sharper (like Z) and tails get thinner.")
     print("3. Effect Size: Move the orange hill.")
     print("   -> Distant hills are easier to distinguish.")
-    
+
     try:
         plot_interactive_alpha_beta()
     except KeyboardInterrupt:
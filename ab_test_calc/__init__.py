@@ -13,19 +13,55 @@ Example:
     >>> from ab_test_calc import calculate_mde_for_sample, print_mde_report
     >>> result = calculate_mde_for_sample(baseline=0.10, sample_size_per_group=5000)
     >>> print_mde_report(result)
+
+    # Batch calculation over a grid of baselines x MDEs
+    >>> from ab_test_calc import calculate_sample_size_batch
+    >>> grid = calculate_sample_size_batch(baseline=[[0.05], [0.10]], mde=[0.01, 0.02])
+    >>> grid['sample_size_control'].shape
+    (2, 2)
 """
 
-from .core import calculate_sample_size, calculate_mde_for_sample
-from .report import print_report, format_result_summary, print_mde_report
-from .validation import ValidationError
-from .cli import run_interactive, main
+import importlib
+
+__version__ = "2.0.0"
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in scipy until a calculation is actually requested.
+_LAZY_EXPORTS = {
+    "calculate_sample_size": ".core",
+    "calculate_sample_size_batch": ".core",
+    "calculate_mde_for_sample": ".core",
+    "SampleSizeResult": ".core",
+    "print_report": ".report",
+    "format_report": ".report",
+    "print_mde_report": ".report",
+    "format_result_summary": ".report",
+    "ValidationError": ".validation",
+    "run_interactive": ".cli",
+    "main": ".cli",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-__version__ = "1.1.0"
 
 __all__ = [
     "calculate_sample_size",
+    "calculate_sample_size_batch",
     "calculate_mde_for_sample",
+    "SampleSizeResult",
     "print_report",
+    "format_report",
     "print_mde_report",
     "format_result_summary",
     "run_interactive",
@@ -7,7 +7,12 @@ from typing import Optional, Any, List
 from .core import calculate_sample_size, calculate_mde_for_sample, DEFAULT_POWER, DEFAULT_ALPHA, DEFAULT_MDE_TYPE
 from .report import print_report, print_mde_report
 
-__version__ = "1.1.0"
+__version__ = "2.0.0"
+
+# Comma handling for user input: decimal comma in numbers ("0,05"), and
+# comma as a separator in weight lists ("50,50").
+_COMMA_DOT = str.maketrans({',': '.'})
+_COMMA_SPACE = str.maketrans({',': ' '})
 
 
 def prompt(
@@ -43,6 +48,10 @@ def prompt(
 
     suffix = f" [{', '.join(suffix_parts)}]" if suffix_parts else ""
 
+    # Hashed membership for the validation below; `options` keeps its order
+    # for the error message.
+    valid_options = frozenset(options) if options else None
+
     while True:
         try:
             raw = input(f"{text}{suffix}: ").strip()
@@ -65,12 +74,12 @@ def prompt(
 
             # Type conversion (handle comma as decimal separator)
             if type_func in (float, int):
-                val = type_func(raw.replace(',', '.'))
+                val = type_func(raw.translate(_COMMA_DOT))
             else:
                 val = type_func(val)
 
             # Validate against options
-            if options and val not in options:
+            if valid_options and val not in valid_options:
                 print(f"   Invalid choice. Options: {', '.join(map(str, options))}")
                 continue
 
@@ -240,7 +249,7 @@ def run_interactive() -> None:
             )
 
             try:
-                parts = weights_input.replace(',', ' ').split()
+                parts = weights_input.translate(_COMMA_SPACE).split()
                 weights = [float(x) for x in parts]
 
                 if len(weights) < 2:
@@ -471,7 +480,7 @@ Examples:
         weights = None
         if args.weights:
             try:
-                parts = args.weights.replace(',', ' ').split()
+                parts = args.weights.translate(_COMMA_SPACE).split()
                 weights = [float(x) for x in parts]
             except ValueError:
                 parser.error(f"Invalid weights format: {args.weights}")
@@ -1,11 +1,17 @@
 """Core sample size calculation logic for A/B tests."""
 
+import math
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
+
 import numpy as np
-from scipy import stats
 from scipy.optimize import brentq
-from typing import Dict, Optional, List, Any
+from scipy.special import ndtri, stdtrit
+from typing import Callable, Dict, Iterator, Optional, List, Tuple, Any
 
-from .validation import validate_inputs, validate_mde_inputs
+from .validation import validate_inputs, validate_mde_inputs, validate_batch_inputs
 
 # Constants
 DEFAULT_POWER = 0.8
@@ -15,13 +21,190 @@ DEFAULT_TEST_TYPE = 'z'
 DEFAULT_SIDES = 2
 CONVERGENCE_THRESHOLD = 0.1
 MAX_ITERATIONS = 15
-INITIAL_N_ESTIMATE = 100000  # Large N for initial Z-approximation
 
 # MDE search bounds
 MDE_SEARCH_MIN = 1e-6
 MDE_SEARCH_MAX_PROPORTION = 0.5  # Max 50% absolute change for proportions
 MDE_SEARCH_TOLERANCE = 1e-6
 
+# Number of distinct calculate_sample_size argument sets kept in memory
+RESULT_CACHE_SIZE = 2048
+
+# Degrees of freedom are rounded to this many decimals before the t quantile
+# lookup so converged iterations hit the cache.
+DF_CACHE_DECIMALS = 6
+
+# From this many degrees of freedom, t quantiles use the Cornish-Fisher
+# expansion around the (cached) normal quantile instead of stdtrit; its
+# truncation error is below 1e-10 relative even far in the tails.
+T_EXPANSION_MIN_DF = 1000
+
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class SampleSizeResult(Mapping):
+    """
+    Immutable result of calculate_sample_size().
+
+    Fields are available as attributes (result.total_sample_size) and, for
+    compatibility with the previous dict return value, by key
+    (result['total_sample_size'], result.get(...), 'key' in result).
+    Fields that do not apply to a design are None.
+    """
+
+    sample_size_per_variant: float
+    sample_size_control: float
+    sample_size_treatment: float
+    total_sample_size: float
+    n_controls: int
+    n_treatments: int
+    baseline_value: float
+    absolute_effect: float
+    alpha_raw: float
+    alpha_corrected: float
+    power: float
+    metric_type: str
+    test_type: str
+    sides: int
+    ratio: float
+    correction: Optional[str] = None
+    weights: Optional[Tuple[float, ...]] = None
+    control_sample_size: Optional[float] = None
+    treatment_sample_size_total: Optional[float] = None
+    std_dev_control: Optional[float] = None
+    std_dev_treatment: Optional[float] = None
+    bottleneck_pair: Optional[str] = None
+    bottleneck_ratio: Optional[float] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _RESULT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_RESULT_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_RESULT_FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare with another result, or with a plain mapping such as the
+        dicts returned by earlier versions (keys absent there must be None).
+        """
+        if isinstance(other, SampleSizeResult):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            if not all(key in _RESULT_FIELDS for key in other):
+                return False
+            theirs = dict(other)
+            if theirs.get('weights') is not None:
+                # Earlier versions echoed weights as the caller's list
+                theirs['weights'] = tuple(theirs['weights'])
+            return all(
+                getattr(self, name) == theirs[name]
+                if name in theirs
+                else getattr(self, name) is None
+                for name in _RESULT_FIELDS
+            )
+        return NotImplemented
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a plain dict."""
+        return {name: getattr(self, name) for name in _RESULT_FIELDS}
+
+
+# Field names in declaration order (dict preserves insertion order)
+_RESULT_FIELDS = dict.fromkeys(f.name for f in fields(SampleSizeResult))
+
+
+def _tail_probability(alpha: float, sides: int) -> float:
+    """Upper-tail probability of the critical value, 1 - alpha/sides."""
+    return 1 - (alpha / 2 if sides == 2 else alpha)
+
+
+@lru_cache(maxsize=256)
+def _z_alpha(alpha: float, sides: int) -> float:
+    """Standard normal critical value for the given alpha and sides."""
+    return float(ndtri(_tail_probability(alpha, sides)))
+
+
+@lru_cache(maxsize=256)
+def _z_beta(power: float) -> float:
+    """Standard normal quantile of the power."""
+    return float(ndtri(power))
+
+
+def _t_from_z(z: float, df: float) -> float:
+    """
+    Student t quantile from the normal quantile z (Cornish-Fisher expansion).
+
+    Terms through 1/df^4; only accurate for large df, see T_EXPANSION_MIN_DF.
+    """
+    z2 = z * z
+    g1 = (z2 + 1) * z / 4
+    g2 = ((5 * z2 + 16) * z2 + 3) * z / 96
+    g3 = (((3 * z2 + 19) * z2 + 17) * z2 - 15) * z / 384
+    g4 = ((((79 * z2 + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) * z / 92160
+    return z + (g1 + (g2 + (g3 + g4 / df) / df) / df) / df
+
+
+@lru_cache(maxsize=1024)
+def _t_alpha(alpha: float, sides: int, df: float) -> float:
+    """Student t critical value for the given alpha, sides and df."""
+    if df >= T_EXPANSION_MIN_DF:
+        return _t_from_z(_z_alpha(alpha, sides), df)
+    return float(stdtrit(df, _tail_probability(alpha, sides)))
+
+
+@lru_cache(maxsize=1024)
+def _t_beta(power: float, df: float) -> float:
+    """Student t quantile of the power."""
+    if df >= T_EXPANSION_MIN_DF:
+        return _t_from_z(_z_beta(power), df)
+    return float(stdtrit(df, power))
+
+
+def _normal_critical(alpha: float, sides: int, df: Optional[float] = None) -> float:
+    """Normal critical value (df is ignored)."""
+    return _z_alpha(alpha, sides)
+
+
+def _t_critical(alpha: float, sides: int, df: Optional[float] = None) -> float:
+    """Student t critical value, with df clamped to at least 1."""
+    if df is None or df < 1:
+        df = 1
+    return _t_alpha(alpha, sides, round(float(df), DF_CACHE_DECIMALS))
+
+
+# Critical value function for each test statistic
+_CRITICAL_VALUE_BY_TEST = {
+    'z': _normal_critical,
+    'chi2': _normal_critical,
+    't': _t_critical,
+}
+
+
+def _sidak(alpha: Any, n_comparisons: int) -> Any:
+    """
+    Sidak-corrected alpha, 1 - (1 - alpha)^(1/n).
+
+    Evaluated as -expm1(log1p(-alpha) / n) to avoid the cancellation in
+    1 - (1 - alpha) for small alpha. Accepts a scalar or a NumPy array.
+    """
+    if isinstance(alpha, np.ndarray):
+        return -np.expm1(np.log1p(-alpha) / n_comparisons)
+    return -math.expm1(math.log1p(-alpha) / n_comparisons)
+
+
+# Corrected alpha for each multiple comparison method, as f(alpha, n_comparisons)
+_CORRECTIONS = {
+    'bonferroni': lambda alpha, n: alpha / n,
+    'sidak': _sidak,
+}
+
 
 def get_critical_value(
     alpha: float,
@@ -41,14 +224,7 @@ def get_critical_value(
     Returns:
         Critical value from the appropriate distribution.
     """
-    alpha_tail = alpha / 2 if sides == 2 else alpha
-
-    if test_type in ('z', 'chi2'):
-        return stats.norm.ppf(1 - alpha_tail)
-    else:  # t-test
-        if df is None or df < 1:
-            df = 1
-        return stats.t.ppf(1 - alpha_tail, df)
+    return _CRITICAL_VALUE_BY_TEST[test_type](alpha, sides, df)
 
 
 def apply_correction(alpha: float, n_comparisons: int, method: str) -> float:
@@ -64,17 +240,267 @@ def apply_correction(alpha: float, n_comparisons: int, method: str) -> float:
         Corrected alpha value.
     """
     method = method.lower()
-    if method == 'bonferroni':
-        return alpha / n_comparisons
-    elif method == 'sidak':
-        return 1 - (1 - alpha) ** (1 / n_comparisons)
+    try:
+        correct = _CORRECTIONS[method]
+    except KeyError:
+        raise ValueError(f"Unknown correction method: {method}") from None
+    return correct(alpha, n_comparisons)
+
+
+@lru_cache(maxsize=128)
+def _corrected_alpha(alpha: float, n_comparisons: int, method: str) -> float:
+    """
+    Scalar apply_correction(), memoized per (alpha, n_comparisons, method).
+
+    The corrected alpha is then the key of the critical-value caches, so a
+    repeated correction scheme reuses both lookups.
+    """
+    return float(apply_correction(alpha, n_comparisons, method))
+
+
+def _resolve_sigmas(
+    std_dev: Optional[float],
+    std_dev_2: Optional[float],
+) -> Tuple[float, float]:
+    """Control and treatment standard deviations (treatment defaults to control)."""
+    sigma1 = std_dev or 0.0
+    sigma2 = std_dev_2 if std_dev_2 is not None else sigma1
+    return sigma1, sigma2
+
+
+def _ceil(x: float) -> float:
+    """math.ceil for scalars, passing NaN and inf through as np.ceil does."""
+    return float(math.ceil(x)) if math.isfinite(x) else x
+
+
+def _proportion_terms(baseline: Any, delta: Any, k: Any) -> Tuple[Any, Any]:
+    """Variance terms of the proportion formula, element-wise over NumPy arrays."""
+    p1 = baseline
+    p2 = p1 + delta
+
+    # Term A: baseline variance for H0
+    term_a = np.sqrt(p1 * (1 - p1) * (1 + 1 / k))
+    # Term B: unpooled variance for H1
+    term_b = np.sqrt(p1 * (1 - p1) + p2 * (1 - p2) / k)
+    return term_a, term_b
+
+
+def _n1_proportion(
+    cv_alpha: float, cv_power: float, term_a: Any, term_b: Any, delta_sq: float
+) -> Any:
+    """Control-group size for proportions."""
+    return (cv_alpha * term_a + cv_power * term_b) ** 2 / delta_sq
+
+
+def _n1_mean(cv_alpha: float, cv_power: float, variance_factor: Any, delta_sq: float) -> Any:
+    """Control-group size for means: (sigma1^2 + sigma2^2/k) * (cv_a + cv_b)^2 / delta^2."""
+    return variance_factor * (cv_alpha + cv_power) ** 2 / delta_sq
+
+
+def _compute_n1_proportion_t(
+    n1: float,
+    k: float,
+    term_a: float,
+    term_b: float,
+    delta_sq: float,
+    alpha_corrected: float,
+    power: float,
+    sides: int,
+) -> float:
+    """One t-test iteration for proportions: df from n1, then a new n1."""
+    # Proportions: simple pooled df
+    df = round(float(max(1, n1 + k * n1 - 2)), DF_CACHE_DECIMALS)
+    cv_alpha = get_critical_value(alpha_corrected, sides, 't', df)
+    cv_power = _t_beta(power, df)
+    return _n1_proportion(cv_alpha, cv_power, term_a, term_b, delta_sq)
+
+
+def _welch_df(v1: Any, v2: Any, n1: Any, n2: Any) -> Any:
+    """
+    Welch-Satterthwaite degrees of freedom.
+
+    Takes the per-group variances of the mean, v = sigma^2 / n, which callers
+    already need for the degenerate-variance check. Scalars or NumPy arrays.
+    """
+    return (v1 + v2) ** 2 / ((v1 ** 2) / (n1 - 1) + (v2 ** 2) / (n2 - 1))
+
+
+def _compute_n1_mean_t(
+    n1: float,
+    k: float,
+    var1: float,
+    var2: float,
+    variance_factor: float,
+    delta_sq: float,
+    alpha_corrected: float,
+    power: float,
+    sides: int,
+) -> float:
+    """
+    One t-test iteration for means: Welch df from n1, then a new n1.
+
+    `var1` and `var2` are the squared standard deviations, computed once
+    outside the iteration.
+    """
+    n2 = k * n1
+
+    # Welch-Satterthwaite degrees of freedom
+    v1 = var1 / n1
+    v2 = var2 / n2
+    if (v1 + v2) < 1e-12:
+        df = n1 + n2 - 2
     else:
-        raise ValueError(f"Unknown correction method: {method}")
+        df = _welch_df(v1, v2, n1, n2)
 
+    df = round(float(df), DF_CACHE_DECIMALS)
+    cv_alpha = get_critical_value(alpha_corrected, sides, 't', df)
+    cv_power = _t_beta(power, df)
+    return _n1_mean(cv_alpha, cv_power, variance_factor, delta_sq)
 
-def _calculate_single_pair(
+
+def _t_df_array(
+    n1: np.ndarray,
+    k: np.ndarray,
+    metric_type: str,
+    sigma1: float,
+    sigma2: float,
+) -> np.ndarray:
+    """Element-wise t-test degrees of freedom for arrays of n1 and ratios."""
+    n2 = k * n1
+    if metric_type == 'mean':
+        # Welch-Satterthwaite degrees of freedom
+        v1 = sigma1 ** 2 / n1
+        v2 = sigma2 ** 2 / n2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            welch = _welch_df(v1, v2, n1, n2)
+        return np.where((v1 + v2) < 1e-12, n1 + n2 - 2, welch)
+    # Proportions: simple pooled df
+    return np.maximum(1, n1 + n2 - 2)
+
+
+def _iterate_t_array(
+    n1: np.ndarray,
+    k: Any,
+    metric_type: str,
+    alpha_corrected: Any,
+    power: Any,
+    sides: int,
+    delta_sq: Any,
+    term_a: Any,
+    term_b: Any,
+    sigma1: float,
+    sigma2: float,
+    variance_factor: Any,
+) -> np.ndarray:
+    """
+    Element-wise t-test iteration, starting from the z estimates in `n1`.
+
+    Same fixed-point iteration as _calculate_single_pair, run on whole arrays
+    (all other array arguments broadcast against `n1`); each element stops
+    updating once it has converged.
+    """
+    alpha_tail = alpha_corrected / 2 if sides == 2 else alpha_corrected
+    active = np.ones(n1.shape, dtype=bool)
+    for _ in range(MAX_ITERATIONS):
+        df = _t_df_array(n1, k, metric_type, sigma1, sigma2)
+        cv_alpha = stdtrit(np.where(df < 1, 1.0, df), 1 - alpha_tail)
+        cv_power = stdtrit(df, power)
+        if metric_type == 'proportion':
+            new_n1 = _n1_proportion(cv_alpha, cv_power, term_a, term_b, delta_sq)
+        else:
+            new_n1 = _n1_mean(cv_alpha, cv_power, variance_factor, delta_sq)
+
+        converged = np.abs(new_n1 - n1) < CONVERGENCE_THRESHOLD
+        n1 = np.where(active, new_n1, n1)
+        active &= ~converged
+        if not active.any():
+            break
+    return n1
+
+
+def _proportion_h0_term(baseline: float, k: float) -> Tuple[float, float]:
+    """
+    Baseline variance p1 * (1 - p1) and Term A of the proportion formula.
+
+    Neither depends on the effect; same expressions as _proportion_terms, on
+    scalars.
+    """
+    p1_var = baseline * (1 - baseline)
+    # Term A: baseline variance for H0
+    return p1_var, math.sqrt(p1_var * (1 + 1 / k))
+
+
+def _proportion_z_n1(
     baseline: float,
+    p1_var: float,
+    term_a: float,
+    k: float,
+    z_alpha: float,
+    z_power: float,
+    delta: float,
+) -> float:
+    """Proportions, z / chi2: closed form, exact since z does not depend on n."""
+    p2 = baseline + delta
+    term_b = math.sqrt(p1_var + p2 * (1 - p2) / k)
+    return _ceil(_n1_proportion(z_alpha, z_power, term_a, term_b, delta ** 2))
+
+
+def _proportion_t_n1(
+    baseline: float,
+    p1_var: float,
+    term_a: float,
+    k: float,
+    z_alpha: float,
+    z_power: float,
+    alpha_corrected: float,
+    power: float,
+    sides: int,
+    delta: float,
+) -> float:
+    """Proportions, t: the z closed form seeds the df fixed-point iteration."""
+    p2 = baseline + delta
+    term_b = math.sqrt(p1_var + p2 * (1 - p2) / k)
+    delta_sq = delta ** 2
+    n1 = _n1_proportion(z_alpha, z_power, term_a, term_b, delta_sq)
+    return _ceil(_iterate_t(
+        _compute_n1_proportion_t, n1,
+        k, term_a, term_b, delta_sq, alpha_corrected, power, sides,
+    ))
+
+
+def _mean_z_n1(
+    variance_factor: float,
+    z_alpha: float,
+    z_power: float,
+    delta: float,
+) -> float:
+    """Means, z: closed form, exact since z does not depend on n."""
+    return _ceil(_n1_mean(z_alpha, z_power, variance_factor, delta ** 2))
+
+
+def _mean_t_n1(
+    k: float,
+    var1: float,
+    var2: float,
+    variance_factor: float,
+    z_alpha: float,
+    z_power: float,
+    alpha_corrected: float,
+    power: float,
+    sides: int,
     delta: float,
+) -> float:
+    """Means, t (Welch): the z closed form seeds the df fixed-point iteration."""
+    delta_sq = delta ** 2
+    n1 = _n1_mean(z_alpha, z_power, variance_factor, delta_sq)
+    return _ceil(_iterate_t(
+        _compute_n1_mean_t, n1,
+        k, var1, var2, variance_factor, delta_sq, alpha_corrected, power, sides,
+    ))
+
+
+def _sample_size_kernel(
+    baseline: float,
     power: float,
     alpha_corrected: float,
     ratio: float,
@@ -83,76 +509,96 @@ def _calculate_single_pair(
     std_dev_2: Optional[float],
     test_type: str,
     sides: int,
-) -> float:
+) -> Callable[[float], float]:
     """
-    Calculate sample size for a single control-treatment pair.
+    Build the control-group size for one pair as a function of the effect.
 
-    Returns:
-        Required sample size for control group (n1).
+    Critical values, sigmas and every term that does not depend on the
+    effect are bound once here, so root-finders over the effect
+    (calculate_mde_for_sample) only pay for the effect-dependent arithmetic.
+    Single evaluations call the _*_n1 functions directly instead.
     """
-    k = ratio
-    sigma1 = std_dev or 0.0
-    sigma2 = std_dev_2 if std_dev_2 is not None else sigma1
-
-    # Prepare variance terms based on metric type
+    z_alpha = get_critical_value(alpha_corrected, sides, 'z')
+    z_power = _z_beta(power)
     if metric_type == 'proportion':
-        p1 = baseline
-        p2 = p1 + delta
+        p1_var, term_a = _proportion_h0_term(baseline, ratio)
+        if test_type == 't':
+            return partial(
+                _proportion_t_n1, baseline, p1_var, term_a, ratio,
+                z_alpha, z_power, alpha_corrected, power, sides,
+            )
+        return partial(_proportion_z_n1, baseline, p1_var, term_a, ratio, z_alpha, z_power)
 
-        # Term A: baseline variance for H0
-        term_a = np.sqrt(p1 * (1 - p1) * (1 + 1 / k))
-        # Term B: unpooled variance for H1
-        term_b = np.sqrt(p1 * (1 - p1) + p2 * (1 - p2) / k)
-    else:
-        term_a = None
-        term_b = None
-
-    def compute_n1(current_n1: float) -> float:
-        """Compute n1 given current estimate (for iterative t-test)."""
-        # Get critical values
-        if test_type in ('z', 'chi2'):
-            cv_alpha = get_critical_value(alpha_corrected, sides, test_type)
-            cv_power = stats.norm.ppf(power)
-        else:  # t-test
-            n1, n2 = current_n1, k * current_n1
-
-            if metric_type == 'mean':
-                # Welch-Satterthwaite degrees of freedom
-                v1 = sigma1 ** 2 / n1
-                v2 = sigma2 ** 2 / n2
-                if (v1 + v2) < 1e-12:
-                    df = n1 + n2 - 2
-                else:
-                    df = (v1 + v2) ** 2 / ((v1 ** 2) / (n1 - 1) + (v2 ** 2) / (n2 - 1))
-            else:
-                # Proportions: simple pooled df
-                df = max(1, n1 + n2 - 2)
+    # Means; chi2 on means is rejected by validation
+    sigma1, sigma2 = _resolve_sigmas(std_dev, std_dev_2)
+    var1 = sigma1 ** 2
+    var2 = sigma2 ** 2
+    variance_factor = var1 + var2 / ratio
+    if test_type == 't':
+        return partial(
+            _mean_t_n1, ratio, var1, var2, variance_factor,
+            z_alpha, z_power, alpha_corrected, power, sides,
+        )
+    return partial(_mean_z_n1, variance_factor, z_alpha, z_power)
 
-            cv_alpha = get_critical_value(alpha_corrected, sides, test_type, df)
-            cv_power = stats.t.ppf(power, df)
 
-        # Calculate n1
-        if metric_type == 'proportion':
-            numerator = (cv_alpha * term_a + cv_power * term_b) ** 2
-        else:
-            # For means: n1 = (sigma1^2 + sigma2^2/k) * (cv_a + cv_b)^2 / delta^2
-            variance_factor = sigma1 ** 2 + sigma2 ** 2 / k
-            numerator = variance_factor * (cv_alpha + cv_power) ** 2
+def _iterate_t(step: Callable[..., float], n1: float, *step_args: Any) -> float:
+    """
+    Iterate a t-test step function to a fixed point, starting from n1.
 
-        return numerator / (delta ** 2)
+    Degrees of freedom depend on n, so the z closed form only seeds the
+    loop. Repeated df values are served from the quantile cache.
+    """
+    for _ in range(MAX_ITERATIONS):
+        prev_n = n1
+        n1 = step(n1, *step_args)
+        if abs(n1 - prev_n) < CONVERGENCE_THRESHOLD:
+            break
+    return n1
 
-    # Initial estimate using Z-approximation
-    n1 = compute_n1(INITIAL_N_ESTIMATE)
 
-    # Iterate for t-test convergence
-    if test_type == 't':
-        for _ in range(MAX_ITERATIONS):
-            prev_n = n1
-            n1 = compute_n1(n1)
-            if abs(n1 - prev_n) < CONVERGENCE_THRESHOLD:
-                break
+def _calculate_single_pair(
+    baseline: float,
+    delta: float,
+    power: float,
+    alpha_corrected: float,
+    ratio: float,
+    metric_type: str,
+    std_dev: Optional[float],
+    std_dev_2: Optional[float],
+    test_type: str,
+    sides: int,
+) -> float:
+    """
+    Calculate sample size for a single control-treatment pair.
+
+    Z / chi2 critical values do not depend on n, so the closed form is
+    exact; for t-tests it is the large-df limit and seeds the iteration.
+
+    Returns:
+        Required sample size for control group (n1).
+    """
+    z_alpha = get_critical_value(alpha_corrected, sides, 'z')
+    z_power = _z_beta(power)
+    if metric_type == 'proportion':
+        p1_var, term_a = _proportion_h0_term(baseline, ratio)
+        if test_type == 't':
+            return _proportion_t_n1(
+                baseline, p1_var, term_a, ratio, z_alpha, z_power,
+                alpha_corrected, power, sides, delta,
+            )
+        return _proportion_z_n1(baseline, p1_var, term_a, ratio, z_alpha, z_power, delta)
 
-    return float(np.ceil(n1))
+    # Means; chi2 on means is rejected by validation
+    sigma1, sigma2 = _resolve_sigmas(std_dev, std_dev_2)
+    if test_type == 't':
+        var1 = sigma1 ** 2
+        var2 = sigma2 ** 2
+        return _mean_t_n1(
+            ratio, var1, var2, var1 + var2 / ratio, z_alpha, z_power,
+            alpha_corrected, power, sides, delta,
+        )
+    return _mean_z_n1(sigma1 ** 2 + sigma2 ** 2 / ratio, z_alpha, z_power, delta)
 
 
 def calculate_sample_size(
@@ -172,7 +618,7 @@ def calculate_sample_size(
     n_treatments: int = 1,
     sides: int = DEFAULT_SIDES,
     weights: Optional[List[float]] = None,
-) -> Dict[str, Any]:
+) -> SampleSizeResult:
     """
     Calculate required sample size for an A/B test.
 
@@ -200,7 +646,15 @@ def calculate_sample_size(
         weights: Traffic weights for all groups [C1, C2..., T1, T2...].
 
     Returns:
-        Dictionary with sample sizes and calculation metadata.
+        SampleSizeResult with sample sizes and calculation metadata. It is
+        read-only and supports both attribute and dict-style access;
+        `weights` is stored as a tuple of floats.
+
+    Results are memoized on the argument values, so repeated queries (e.g.
+    re-rendering a dashboard) skip validation and the math and return the
+    same immutable result object. The cache can be inspected with
+    calculate_sample_size.cache_info() and emptied with
+    calculate_sample_size.cache_clear().
 
     Examples:
         Simple A/B test:
@@ -214,6 +668,60 @@ def calculate_sample_size(
         ...     correction='bonferroni'
         ... )
     """
+    args = tuple(_cache_arg(value) for value in (
+        baseline, mde, power, alpha, mde_type, ratio, metric_type,
+        std_dev, std_dev_2, test_type, n_comparisons, correction,
+        n_controls, n_treatments, sides,
+    )) + (_weights_key(weights),)
+    try:
+        hash(args)
+    except TypeError:
+        # Unhashable input (e.g. a list std_dev): skip the cache and let
+        # validation report it as before
+        return _cached_sample_size.__wrapped__(*args)
+    return _cached_sample_size(*args)
+
+
+def _cache_arg(value: Any) -> Any:
+    """Hashable form of an argument: 0-d NumPy arrays become Python scalars."""
+    if isinstance(value, np.ndarray) and value.ndim == 0:
+        return value.item()
+    return value
+
+
+def _weights_key(weights: Optional[List[float]]) -> Optional[Tuple[Any, ...]]:
+    """Weights as a tuple of floats, so [50, 50] and [50.0, 50.0] share an entry."""
+    if weights is None:
+        return None
+    try:
+        return tuple(float(w) for w in weights)
+    except (TypeError, ValueError):
+        # Left for validation to reject
+        return tuple(weights)
+
+
+# typed=True keeps e.g. sides=2 and sides=2.0 apart, so the input values
+# echoed in a result are always the caller's own
+@lru_cache(maxsize=RESULT_CACHE_SIZE, typed=True)
+def _cached_sample_size(
+    baseline: float,
+    mde: float,
+    power: float,
+    alpha: float,
+    mde_type: str,
+    ratio: float,
+    metric_type: str,
+    std_dev: Optional[float],
+    std_dev_2: Optional[float],
+    test_type: str,
+    n_comparisons: Optional[int],
+    correction: Optional[str],
+    n_controls: int,
+    n_treatments: int,
+    sides: int,
+    weights: Optional[Tuple[float, ...]],
+) -> SampleSizeResult:
+    """Memoized body of calculate_sample_size (weights passed as a tuple of floats)."""
     # Normalize inputs
     n_controls = max(1, n_controls)
     n_treatments = max(1, n_treatments)
@@ -224,7 +732,7 @@ def calculate_sample_size(
     n_comparisons = max(1, n_comparisons)
 
     # Validate all inputs
-    validate_inputs(
+    weights_array = validate_inputs(
         baseline=baseline,
         mde=mde,
         power=power,
@@ -252,7 +760,7 @@ def calculate_sample_size(
     # Apply multiple comparison correction
     alpha_corrected = alpha
     if correction:
-        alpha_corrected = apply_correction(alpha, n_comparisons, correction)
+        alpha_corrected = _corrected_alpha(alpha, n_comparisons, correction)
 
     # Handle weighted design (worst-case pair logic)
     if weights is not None:
@@ -272,6 +780,7 @@ def calculate_sample_size(
             n_treatments=n_treatments,
             sides=sides,
             weights=weights,
+            weights_array=weights_array,
         )
 
     # Standard calculation (uniform or simple ratio)
@@ -288,32 +797,36 @@ def calculate_sample_size(
         sides=sides,
     )
 
-    n2 = float(np.ceil(n1 * ratio))
+    n2 = _ceil(n1 * ratio)
     total = (n1 * n_controls) + (n2 * n_treatments)
 
-    return {
-        "sample_size_per_variant": n1,
-        "sample_size_control": n1,
-        "sample_size_treatment": n2,
-        "total_sample_size": total,
-        "n_controls": n_controls,
-        "n_treatments": n_treatments,
-        "control_sample_size": n1 * n_controls,
-        "treatment_sample_size_total": n2 * n_treatments,
-        "baseline_value": baseline,
-        "absolute_effect": delta,
-        "alpha_raw": alpha,
-        "alpha_corrected": alpha_corrected,
-        "metric_type": metric_type,
-        "test_type": test_type,
-        "std_dev_control": std_dev if metric_type == 'mean' else None,
-        "std_dev_treatment": std_dev_2 if metric_type == 'mean' else None,
-        "sides": sides,
-        "ratio": ratio,
-        "power": power,
-        "weights": weights,
-        "correction": correction,
-    }
+    return SampleSizeResult(
+        sample_size_per_variant=n1,
+        sample_size_control=n1,
+        sample_size_treatment=n2,
+        total_sample_size=total,
+        n_controls=n_controls,
+        n_treatments=n_treatments,
+        control_sample_size=n1 * n_controls,
+        treatment_sample_size_total=n2 * n_treatments,
+        baseline_value=baseline,
+        absolute_effect=delta,
+        alpha_raw=alpha,
+        alpha_corrected=alpha_corrected,
+        metric_type=metric_type,
+        test_type=test_type,
+        std_dev_control=std_dev if metric_type == 'mean' else None,
+        std_dev_treatment=std_dev_2 if metric_type == 'mean' else None,
+        sides=sides,
+        ratio=ratio,
+        power=power,
+        weights=weights,
+        correction=correction,
+    )
+
+
+calculate_sample_size.cache_info = _cached_sample_size.cache_info
+calculate_sample_size.cache_clear = _cached_sample_size.cache_clear
 
 
 def _calculate_weighted_design(
@@ -332,74 +845,252 @@ def _calculate_weighted_design(
     n_treatments: int,
     sides: int,
     weights: List[float],
-) -> Dict[str, Any]:
+    weights_array: np.ndarray,
+) -> SampleSizeResult:
     """
     Calculate sample size for weighted multi-group design.
 
     Uses worst-case pair logic to ensure all comparisons meet power requirements.
+    `weights_array` is `weights` as already converted by validate_inputs.
     """
     # Normalize weights
-    total_w = sum(weights)
-    norm_weights = [w / total_w for w in weights]
-
-    w_controls = norm_weights[:n_controls]
-    w_treatments = norm_weights[n_controls:]
-
-    # Find worst-case pair (requires most samples)
-    worst_case = None
-    max_total = 0
-
-    for i, w_c in enumerate(w_controls):
-        for j, w_t in enumerate(w_treatments):
-            k_pair = w_t / w_c
-
-            n_control = _calculate_single_pair(
-                baseline=baseline,
-                delta=delta,
-                power=power,
-                alpha_corrected=alpha_corrected,
-                ratio=k_pair,
-                metric_type=metric_type,
-                std_dev=std_dev,
-                std_dev_2=std_dev_2,
-                test_type=test_type,
-                sides=sides,
-            )
+    shares = weights_array / weights_array.sum()
+    w_controls = shares[:n_controls]
+    w_treatments = shares[n_controls:]
+
+    # Every (control, treatment) pair is evaluated in one broadcast
+    w_c = w_controls[:, None]
+    w_t = w_treatments[None, :]
+    k_pairs = w_t / w_c
+
+    # Z / chi2 closed form: exact for those tests, the seed for t-tests
+    delta_sq = delta ** 2
+    z_alpha = get_critical_value(alpha_corrected, sides, 'z')
+    z_power = _z_beta(power)
+    sigma1, sigma2 = _resolve_sigmas(std_dev, std_dev_2)
+    if metric_type == 'proportion':
+        term_a, term_b = _proportion_terms(baseline, delta, k_pairs)
+        variance_factor = None
+        n_controls_mat = _n1_proportion(z_alpha, z_power, term_a, term_b, delta_sq)
+    else:
+        term_a = term_b = None
+        variance_factor = sigma1 ** 2 + sigma2 ** 2 / k_pairs
+        n_controls_mat = _n1_mean(z_alpha, z_power, variance_factor, delta_sq)
+
+    if test_type == 't':
+        n_controls_mat = _iterate_t_array(
+            n_controls_mat, k_pairs, metric_type, alpha_corrected, power, sides,
+            delta_sq, term_a, term_b, sigma1, sigma2, variance_factor,
+        )
+
+    totals = np.ceil(n_controls_mat) / w_c
+
+    # argmax returns the first maximum in (control, treatment) order; pairs
+    # whose t-iteration broke down (NaN) never count as the bottleneck
+    ranked = np.where(np.isnan(totals), -np.inf, totals)
+    i, j = np.unravel_index(ranked.argmax(), ranked.shape)
+    max_total = float(totals[i, j])
+    bottleneck_pair = f"C{i + 1} vs T{j + 1}"
+    bottleneck_ratio = float(k_pairs[i, j])
+
+    return SampleSizeResult(
+        sample_size_control=max_total * float(w_controls.mean()),
+        sample_size_treatment=max_total * float(w_treatments.mean()),
+        sample_size_per_variant=max_total / (n_controls + n_treatments),
+        total_sample_size=max_total,
+        baseline_value=baseline,
+        absolute_effect=delta,
+        alpha_raw=alpha,
+        alpha_corrected=alpha_corrected,
+        power=power,
+        ratio=bottleneck_ratio,
+        metric_type=metric_type,
+        test_type=test_type,
+        n_controls=n_controls,
+        n_treatments=n_treatments,
+        sides=sides,
+        bottleneck_pair=bottleneck_pair,
+        bottleneck_ratio=bottleneck_ratio,
+        weights=weights,
+        correction=correction,
+    )
+
+
+def calculate_sample_size_batch(
+    baseline: Any,
+    mde: Any,
+    power: Any = DEFAULT_POWER,
+    alpha: Any = DEFAULT_ALPHA,
+    mde_type: str = DEFAULT_MDE_TYPE,
+    ratio: float = 1.0,
+    metric_type: str = 'proportion',
+    std_dev: Optional[float] = None,
+    std_dev_2: Optional[float] = None,
+    test_type: str = DEFAULT_TEST_TYPE,
+    n_comparisons: int = 1,
+    correction: Optional[str] = None,
+    sides: int = DEFAULT_SIDES,
+) -> Dict[str, Any]:
+    """
+    Calculate sample sizes for a whole grid of scenarios at once.
+
+    `baseline`, `mde`, `power` and `alpha` may be scalars or array-likes;
+    they are broadcast together with NumPy rules and every combination is
+    solved in one vectorized pass. Each element equals what
+    calculate_sample_size() returns for a one-control, one-treatment design
+    with the same parameters.
 
-            total_required = n_control / w_c
+    Args:
+        baseline: Current metric value(s).
+        mde: Minimum Detectable Effect(s).
+        power: Statistical power(s).
+        alpha: Significance level(s).
+        mde_type: 'absolute' (default) or 'relative'.
+        ratio: Treatment/Control size ratio.
+        metric_type: 'proportion' or 'mean'.
+        std_dev: Standard deviation for control (required for means).
+        std_dev_2: Standard deviation for treatment (enables Welch's test).
+        test_type: 'z' (default), 't', or 'chi2'.
+        n_comparisons: Number of hypotheses the correction accounts for.
+        correction: 'bonferroni', 'sidak', or None.
+        sides: 1 (one-sided) or 2 (two-sided).
 
-            if total_required > max_total:
-                max_total = total_required
-                worst_case = {
-                    'pair': f"C{i + 1} vs T{j + 1}",
-                    'ratio': k_pair,
-                    'w_c': w_c,
-                    'w_t': w_t,
-                }
+    Returns:
+        Dictionary of arrays (shape of the broadcast inputs) with sample sizes,
+        plus the scalar settings used.
+
+    Examples:
+        Sample size for a grid of baselines x MDEs:
+        >>> result = calculate_sample_size_batch(
+        ...     baseline=[[0.05], [0.10], [0.20]],
+        ...     mde=[0.01, 0.02, 0.03],
+        ... )
+        >>> result['sample_size_control'].shape
+        (3, 3)
+    """
+    baseline, mde, power, alpha = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (baseline, mde, power, alpha))
+    )
+    n_comparisons = max(1, n_comparisons)
+
+    validate_batch_inputs(
+        baseline=baseline,
+        mde=mde,
+        power=power,
+        alpha=alpha,
+        mde_type=mde_type,
+        ratio=ratio,
+        metric_type=metric_type,
+        std_dev=std_dev,
+        std_dev_2=std_dev_2,
+        test_type=test_type,
+        n_comparisons=n_comparisons,
+        correction=correction,
+        sides=sides,
+    )
+
+    # Calculate effect size (delta)
+    delta = baseline * mde if mde_type == 'relative' else mde
+
+    # Apply multiple comparison correction
+    alpha_corrected = alpha
+    if correction:
+        alpha_corrected = apply_correction(alpha, n_comparisons, correction)
+
+    # Z closed form: exact for z / chi2, the seed for t-tests
+    k = ratio
+    delta_sq = delta ** 2
+    alpha_tail = alpha_corrected / 2 if sides == 2 else alpha_corrected
+    z_alpha = ndtri(1 - alpha_tail)
+    z_power = ndtri(power)
+    sigma1, sigma2 = _resolve_sigmas(std_dev, std_dev_2)
+    if metric_type == 'proportion':
+        term_a, term_b = _proportion_terms(baseline, delta, k)
+        variance_factor = None
+        n1 = _n1_proportion(z_alpha, z_power, term_a, term_b, delta_sq)
+    else:
+        term_a = term_b = None
+        variance_factor = sigma1 ** 2 + sigma2 ** 2 / k
+        n1 = _n1_mean(z_alpha, z_power, variance_factor, delta_sq)
+
+    if test_type == 't':
+        n1 = _iterate_t_array(
+            n1, k, metric_type, alpha_corrected, power, sides,
+            delta_sq, term_a, term_b, sigma1, sigma2, variance_factor,
+        )
+
+    n1 = np.ceil(n1)
+    n2 = np.ceil(n1 * ratio)
 
     return {
-        'sample_size_control': max_total * (sum(w_controls) / n_controls),
-        'sample_size_treatment': max_total * (sum(w_treatments) / n_treatments),
-        'sample_size_per_variant': max_total / (n_controls + n_treatments),
-        'total_sample_size': max_total,
-        'baseline_value': baseline,
-        'absolute_effect': delta,
-        'alpha_raw': alpha,
-        'alpha_corrected': alpha_corrected,
-        'power': power,
-        'ratio': worst_case['ratio'],
-        'metric_type': metric_type,
-        'test_type': test_type,
-        'n_controls': n_controls,
-        'n_treatments': n_treatments,
-        'sides': sides,
-        'bottleneck_pair': worst_case['pair'],
-        'bottleneck_ratio': worst_case['ratio'],
-        'weights': weights,
-        'correction': correction,
+        "sample_size_per_variant": n1,
+        "sample_size_control": n1,
+        "sample_size_treatment": n2,
+        "total_sample_size": n1 + n2,
+        "baseline_value": baseline,
+        "absolute_effect": delta,
+        "alpha_raw": alpha,
+        "alpha_corrected": alpha_corrected,
+        "power": power,
+        "metric_type": metric_type,
+        "test_type": test_type,
+        "sides": sides,
+        "ratio": ratio,
+        "correction": correction,
     }
 
 
+def _z_mde(
+    baseline: float,
+    n1: float,
+    power: float,
+    alpha: float,
+    ratio: float,
+    metric_type: str,
+    std_dev: Optional[float],
+    std_dev_2: Optional[float],
+    sides: int,
+) -> float:
+    """
+    Closed-form MDE for z-tests: the effect at which the required n1 equals n1.
+
+    Means invert (z_a + z_b)^2 * variance_factor / delta^2 = n1 directly.
+    Proportions square z_a*A + z_b*B(delta) = sqrt(n1)*delta into a quadratic
+    in delta and keep the root that satisfies the unsquared equation.
+    Returns NaN when no admissible root exists.
+    """
+    k = ratio
+    z_alpha = get_critical_value(alpha, sides, 'z')
+    z_power = _z_beta(power)
+
+    if metric_type != 'proportion':
+        sigma1, sigma2 = _resolve_sigmas(std_dev, std_dev_2)
+        variance_factor = sigma1 ** 2 + sigma2 ** 2 / k
+        return (z_alpha + z_power) * math.sqrt(variance_factor / n1)
+
+    p1_var = baseline * (1 - baseline)
+    term_a = math.sqrt(p1_var * (1 + 1 / k))
+    root_n = math.sqrt(n1)
+    # (n1 + z_b^2/k) d^2 - (2 sqrt(n1) z_a A + z_b^2 (1 - 2p)/k) d
+    #   + z_a^2 A^2 - z_b^2 p(1 - p)(1 + 1/k) = 0
+    qa = n1 + z_power ** 2 / k
+    qb = -(2 * root_n * z_alpha * term_a + z_power ** 2 * (1 - 2 * baseline) / k)
+    qc = (z_alpha * term_a) ** 2 - z_power ** 2 * p1_var * (1 + 1 / k)
+    disc = qb ** 2 - 4 * qa * qc
+    if disc < 0:
+        return float('nan')
+
+    def residual(delta: float) -> float:
+        p2 = baseline + delta
+        var_b = p1_var + p2 * (1 - p2) / k
+        if delta <= 0 or var_b < 0:
+            return float('inf')
+        return abs(z_alpha * term_a + z_power * math.sqrt(var_b) - root_n * delta)
+
+    sqrt_disc = math.sqrt(disc)
+    return min(((-qb + sqrt_disc) / (2 * qa), (-qb - sqrt_disc) / (2 * qa)), key=residual)
+
+
 def calculate_mde_for_sample(
     baseline: float,
     sample_size_per_group: int,
@@ -440,7 +1131,7 @@ def calculate_mde_for_sample(
         ...     power=0.8
         ... )
         >>> print(f"MDE: {result['mde']:.4f}")
-        MDE: 0.0168
+        MDE: 0.0170
     """
     # Validate inputs
     validate_mde_inputs(
@@ -468,25 +1159,31 @@ def calculate_mde_for_sample(
         sigma = std_dev or 1.0
         max_mde = sigma * 5  # 5 standard deviations as upper bound
 
+    # Z-tests have a closed form; the root search below is for t-tests
+    # (df depends on n) and for effects outside the search bounds.
+    if test_type != 't':
+        mde = _z_mde(
+            baseline, n1, power, alpha, ratio, metric_type, std_dev, std_dev_2, sides,
+        )
+        if MDE_SEARCH_MIN <= mde <= max_mde:
+            return _mde_result(
+                mde, baseline, n1, power, alpha, ratio, metric_type,
+                std_dev, std_dev_2, test_type, sides,
+            )
+
+    # Everything except the effect is fixed across the root search
+    required_n = _sample_size_kernel(
+        baseline, power, alpha, ratio, metric_type,
+        std_dev, std_dev_2, test_type, sides,
+    )
+
     def required_n_for_mde(mde: float) -> float:
         """Return difference between required N and available N."""
         if mde <= 0:
             return float('inf')
 
         try:
-            result = _calculate_single_pair(
-                baseline=baseline,
-                delta=mde,
-                power=power,
-                alpha_corrected=alpha,
-                ratio=ratio,
-                metric_type=metric_type,
-                std_dev=std_dev,
-                std_dev_2=std_dev_2,
-                test_type=test_type,
-                sides=sides,
-            )
-            return result - n1
+            return required_n(mde) - n1
         except (ValueError, ZeroDivisionError):
             return float('inf')
 
@@ -518,6 +1215,26 @@ def calculate_mde_for_sample(
         else:
             mde = (low + high) / 2
 
+    return _mde_result(
+        mde, baseline, n1, power, alpha, ratio, metric_type,
+        std_dev, std_dev_2, test_type, sides,
+    )
+
+
+def _mde_result(
+    mde: float,
+    baseline: float,
+    n1: int,
+    power: float,
+    alpha: float,
+    ratio: float,
+    metric_type: str,
+    std_dev: Optional[float],
+    std_dev_2: Optional[float],
+    test_type: str,
+    sides: int,
+) -> Dict[str, Any]:
+    """Assemble the calculate_mde_for_sample() result dictionary."""
     # Calculate relative MDE
     if baseline != 0:
         mde_relative = mde / baseline
@@ -533,8 +1250,8 @@ def calculate_mde_for_sample(
         'baseline_value': baseline,
         'target_value': target,
         'sample_size_per_group': n1,
-        'sample_size_treatment': int(np.ceil(n1 * ratio)),
-        'total_sample_size': int(n1 + np.ceil(n1 * ratio)),
+        'sample_size_treatment': math.ceil(n1 * ratio),
+        'total_sample_size': int(n1 + math.ceil(n1 * ratio)),
         'power': power,
         'alpha': alpha,
         'ratio': ratio,
@@ -1,88 +1,116 @@
 """Report formatting for A/B test calculation results."""
 
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, List, Mapping, Optional
 
 
-def print_report(result: Dict[str, Any]) -> None:
+def print_report(result: Mapping[str, Any]) -> None:
     """
     Display a formatted, human-readable report of calculation results.
 
     Args:
-        result: Dictionary returned by calculate_sample_size().
+        result: SampleSizeResult returned by calculate_sample_size() (a plain
+            dict with the same keys also works).
 
     Example:
         >>> result = calculate_sample_size(baseline=0.2, mde=0.05)
         >>> print_report(result)
     """
-    print("\n" + "=" * 40)
-    print("             RESULTS")
-    print("=" * 40)
+    # The report is written in one call rather than printed line by line
+    sys.stdout.write(format_report(result))
+
+
+def format_report(result: Mapping[str, Any]) -> str:
+    """
+    Build the text displayed by print_report().
+
+    Useful for combining several reports into a single write.
+
+    Args:
+        result: SampleSizeResult returned by calculate_sample_size() (a plain
+            dict with the same keys also works).
+
+    Returns:
+        Report text, ending with a newline.
+    """
+    out: List[str] = []
+    out.append("\n" + "=" * 40)
+    out.append("             RESULTS")
+    out.append("=" * 40)
 
     # Context summary
-    print(f"Metric:          {result['metric_type'].title()}")
-    print(f"Design:          {result['n_controls']} Control(s) vs {result['n_treatments']} Treatment(s)")
+    out.append(f"Metric:          {result['metric_type'].title()}")
+    out.append(f"Design:          {result['n_controls']} Control(s) vs {result['n_treatments']} Treatment(s)")
 
     # Test type with Welch's indicator
-    is_welch = (
-        result.get('std_dev_treatment')
-        and result.get('std_dev_control')
-        and result['std_dev_control'] != result['std_dev_treatment']
-    )
-    test_prefix = "Welch's " if is_welch else ""
-    test_suffix = "T-Test" if result['test_type'] == 't' else "Z-Test"
-    print(f"Test Type:       {test_prefix}{test_suffix}, {result['sides']}-Sided")
+    std_c = result.get('std_dev_control')
+    std_t = result.get('std_dev_treatment')
+    out.append(f"Test Type:       {_test_type_label(result, std_c, std_t)}")
 
     # Bottleneck pair for weighted designs
     if result.get('bottleneck_pair'):
-        print(f"Bottleneck:      {result['bottleneck_pair']} (Requires most samples)")
+        out.append(f"Bottleneck:      {result['bottleneck_pair']} (Requires most samples)")
 
     # Baseline and target values
     if result['metric_type'] == 'proportion':
         baseline = result['baseline_value']
         delta = result['absolute_effect']
         target = baseline + delta
-        print(f"Baseline:        {baseline:.2%}")
-        print(f"Target:          {target:.2%}")
+        out.append(f"Baseline:        {baseline:.2%}")
+        out.append(f"Target:          {target:.2%}")
         sign = '+' if delta > 0 else ''
-        print(f"Lift (Abs):      {sign}{delta:.2%}")
+        out.append(f"Lift (Abs):      {sign}{delta:.2%}")
     else:
-        print(f"Baseline:        {result['baseline_value']}")
-        print(f"MDE (Abs):       {result['absolute_effect']}")
-        if result.get('std_dev_control'):
-            print(f"Std Dev (Ctrl):  {result['std_dev_control']}")
-        if result.get('std_dev_treatment') and result.get('std_dev_treatment') != result.get('std_dev_control'):
-            print(f"Std Dev (Trt):   {result['std_dev_treatment']}")
+        out.append(f"Baseline:        {result['baseline_value']}")
+        out.append(f"MDE (Abs):       {result['absolute_effect']}")
+        if std_c:
+            out.append(f"Std Dev (Ctrl):  {std_c}")
+        if std_t and std_t != std_c:
+            out.append(f"Std Dev (Trt):   {std_t}")
 
     # Alpha (with correction info if applicable)
     if result['alpha_corrected'] != result['alpha_raw']:
         correction_label = result.get('correction', 'adjusted')
-        print(f"Alpha (Adj):     {result['alpha_corrected']:.5f} ({correction_label})")
+        out.append(f"Alpha (Adj):     {result['alpha_corrected']:.5f} ({correction_label})")
     else:
-        print(f"Alpha:           {result['alpha_raw']}")
+        out.append(f"Alpha:           {result['alpha_raw']}")
 
-    print(f"Power:           {result['power']:.0%}")
+    out.append(f"Power:           {result['power']:.0%}")
 
-    print("-" * 40)
+    out.append("-" * 40)
 
     # Sample sizes
     weights = result.get('weights')
     if weights:
-        _print_weighted_breakdown(result, weights)
+        _append_weighted_breakdown(result, weights, out)
     else:
-        _print_standard_breakdown(result)
+        _append_standard_breakdown(result, out)
 
-    print("=" * 40 + "\n")
+    out.append("=" * 40 + "\n")
+    return "\n".join(out) + "\n"
 
 
-def _print_weighted_breakdown(result: Dict[str, Any], weights: list) -> None:
-    """Print sample size breakdown for weighted designs."""
+def _test_type_label(
+    result: Mapping[str, Any],
+    std_c: Optional[float],
+    std_t: Optional[float],
+) -> str:
+    """Describe the test, e.g. "Welch's T-Test, 2-Sided"."""
+    is_welch = bool(std_t and std_c and std_c != std_t)
+    test_prefix = "Welch's " if is_welch else ""
+    test_suffix = "T-Test" if result['test_type'] == 't' else "Z-Test"
+    return f"{test_prefix}{test_suffix}, {result['sides']}-Sided"
+
+
+def _append_weighted_breakdown(result: Mapping[str, Any], weights: tuple, out: List[str]) -> None:
+    """Append the sample size breakdown lines for weighted designs to `out`."""
     total_n = result['total_sample_size']
     total_w = sum(weights)
     shares = [w / total_w for w in weights]
 
-    print(f"Total Sample Size:        {int(total_n):,}")
-    print("-" * 40)
-    print("Group Breakdown:")
+    out.append(f"Total Sample Size:        {int(total_n):,}")
+    out.append("-" * 40)
+    out.append("Group Breakdown:")
 
     n_ctrl = result['n_controls']
     n_trt = result['n_treatments']
@@ -91,36 +119,37 @@ def _print_weighted_breakdown(result: Dict[str, Any], weights: list) -> None:
     for i in range(n_ctrl):
         share = shares[idx]
         n_group = total_n * share
-        print(f"   Control {i + 1} ({share:.1%}):    {int(n_group):,}")
+        out.append(f"   Control {i + 1} ({share:.1%}):    {int(n_group):,}")
         idx += 1
 
     for i in range(n_trt):
         share = shares[idx]
         n_group = total_n * share
-        print(f"   Treatment {i + 1} ({share:.1%}):  {int(n_group):,}")
+        out.append(f"   Treatment {i + 1} ({share:.1%}):  {int(n_group):,}")
         idx += 1
 
 
-def _print_standard_breakdown(result: Dict[str, Any]) -> None:
-    """Print sample size breakdown for standard designs."""
+def _append_standard_breakdown(result: Mapping[str, Any], out: List[str]) -> None:
+    """Append the sample size breakdown lines for standard designs to `out`."""
     ratio = result['ratio']
 
     if abs(ratio - 1.0) > 1e-5:
-        print(f"Ratio (Trt/Ctrl): {ratio:.2f}")
-        print(f"N (Control):           {int(result['sample_size_control']):,}")
-        print(f"N (Treatment):         {int(result['sample_size_treatment']):,}")
+        out.append(f"Ratio (Trt/Ctrl): {ratio:.2f}")
+        out.append(f"N (Control):           {int(result['sample_size_control']):,}")
+        out.append(f"N (Treatment):         {int(result['sample_size_treatment']):,}")
     else:
-        print(f"Sample Size Per Group: {int(result['sample_size_per_variant']):,}")
+        out.append(f"Sample Size Per Group: {int(result['sample_size_per_variant']):,}")
 
-    print(f"TOTAL Sample Size:     {int(result['total_sample_size']):,}")
+    out.append(f"TOTAL Sample Size:     {int(result['total_sample_size']):,}")
 
 
-def format_result_summary(result: Dict[str, Any]) -> str:
+def format_result_summary(result: Mapping[str, Any]) -> str:
     """
     Format a one-line summary of the result.
 
     Args:
-        result: Dictionary returned by calculate_sample_size().
+        result: SampleSizeResult returned by calculate_sample_size() (a plain
+            dict with the same keys also works).
 
     Returns:
         Formatted string summary.
@@ -147,64 +176,56 @@ def print_mde_report(result: Dict[str, Any]) -> None:
         >>> result = calculate_mde_for_sample(baseline=0.10, sample_size_per_group=5000)
         >>> print_mde_report(result)
     """
-    print("\n" + "=" * 40)
-    print("        MDE CALCULATION RESULTS")
-    print("=" * 40)
+    out: List[str] = []
+    out.append("\n" + "=" * 40)
+    out.append("        MDE CALCULATION RESULTS")
+    out.append("=" * 40)
 
     # Context summary
-    print(f"Metric:          {result['metric_type'].title()}")
+    out.append(f"Metric:          {result['metric_type'].title()}")
 
     # Test type with Welch's indicator
-    is_welch = (
-        result.get('std_dev_treatment')
-        and result.get('std_dev_control')
-        and result['std_dev_control'] != result['std_dev_treatment']
-    )
-    test_prefix = "Welch's " if is_welch else ""
-    test_suffix = "T-Test" if result['test_type'] == 't' else "Z-Test"
-    print(f"Test Type:       {test_prefix}{test_suffix}, {result['sides']}-Sided")
+    std_c = result.get('std_dev_control')
+    std_t = result.get('std_dev_treatment')
+    out.append(f"Test Type:       {_test_type_label(result, std_c, std_t)}")
 
-    print("-" * 40)
+    out.append("-" * 40)
 
     # Given parameters
-    print("GIVEN:")
-    print(f"  Sample Size (per group): {result['sample_size_per_group']:,}")
+    out.append("GIVEN:")
+    out.append(f"  Sample Size (per group): {result['sample_size_per_group']:,}")
     if result['ratio'] != 1.0:
-        print(f"  Ratio (Trt/Ctrl):        {result['ratio']:.2f}")
-        print(f"  Total Sample Size:       {result['total_sample_size']:,}")
-    print(f"  Power:                   {result['power']:.0%}")
-    print(f"  Alpha:                   {result['alpha']}")
+        out.append(f"  Ratio (Trt/Ctrl):        {result['ratio']:.2f}")
+        out.append(f"  Total Sample Size:       {result['total_sample_size']:,}")
+    out.append(f"  Power:                   {result['power']:.0%}")
+    out.append(f"  Alpha:                   {result['alpha']}")
 
-    print("-" * 40)
+    out.append("-" * 40)
 
     # Calculated MDE
-    print("RESULT:")
-    if result['metric_type'] == 'proportion':
-        baseline = result['baseline_value']
-        mde = result['mde']
-        target = result['target_value']
-        mde_rel = result.get('mde_relative')
+    out.append("RESULT:")
+    baseline = result['baseline_value']
+    mde = result['mde']
+    target = result['target_value']
+    mde_rel = result.get('mde_relative')
 
-        print(f"  Baseline:                {baseline:.2%}")
-        print(f"  Minimum Detectable MDE:  {mde:.2%} (absolute)")
+    if result['metric_type'] == 'proportion':
+        out.append(f"  Baseline:                {baseline:.2%}")
+        out.append(f"  Minimum Detectable MDE:  {mde:.2%} (absolute)")
         if mde_rel is not None:
-            print(f"                           {mde_rel:.1%} (relative)")
-        print(f"  Detectable Target:       {target:.2%}")
+            out.append(f"                           {mde_rel:.1%} (relative)")
+        out.append(f"  Detectable Target:       {target:.2%}")
     else:
-        baseline = result['baseline_value']
-        mde = result['mde']
-        target = result['target_value']
-        mde_rel = result.get('mde_relative')
-
-        print(f"  Baseline:                {baseline}")
-        print(f"  Minimum Detectable MDE:  {mde:.4f} (absolute)")
+        out.append(f"  Baseline:                {baseline}")
+        out.append(f"  Minimum Detectable MDE:  {mde:.4f} (absolute)")
         if mde_rel is not None:
-            print(f"                           {mde_rel:.1%} (relative)")
-        print(f"  Detectable Target:       {target:.4f}")
+            out.append(f"                           {mde_rel:.1%} (relative)")
+        out.append(f"  Detectable Target:       {target:.4f}")
 
-        if result.get('std_dev_control'):
-            print(f"  Std Dev (Ctrl):          {result['std_dev_control']}")
-        if result.get('std_dev_treatment') and result.get('std_dev_treatment') != result.get('std_dev_control'):
-            print(f"  Std Dev (Trt):           {result['std_dev_treatment']}")
+        if std_c:
+            out.append(f"  Std Dev (Ctrl):          {std_c}")
+        if std_t and std_t != std_c:
+            out.append(f"  Std Dev (Trt):           {std_t}")
 
-    print("=" * 40 + "\n")
+    out.append("=" * 40 + "\n")
+    sys.stdout.write("\n".join(out) + "\n")
@@ -2,12 +2,56 @@
 
 from typing import Optional, List
 
+import numpy as np
+
+# Allowed values for categorical parameters
+_VALID_METRIC_TYPES = frozenset({'proportion', 'mean'})
+_VALID_MDE_TYPES = frozenset({'relative', 'absolute'})
+_VALID_TEST_TYPES = frozenset({'z', 't', 'chi2'})
+_VALID_MDE_TEST_TYPES = frozenset({'z', 't'})
+_VALID_SIDES = frozenset({1, 2})
+_VALID_CORRECTIONS = frozenset({'bonferroni', 'sidak'})
+
 
 class ValidationError(ValueError):
     """Raised when input validation fails."""
     pass
 
 
+def _shared_inputs_ok(
+    alpha: float,
+    power: float,
+    sides: int,
+    ratio: float,
+    metric_type: str,
+    baseline: float,
+    std_dev: Optional[float],
+    std_dev_2: Optional[float],
+) -> bool:
+    """
+    True if the parameters common to the scalar validators are all valid.
+
+    A single boolean expression with no message formatting; the detailed
+    checks only run (and build messages) when this returns False.
+    """
+    if metric_type == 'proportion':
+        metric_ok = 0 < baseline < 1
+    else:
+        metric_ok = (
+            metric_type == 'mean'
+            and std_dev is not None and std_dev > 0
+            and (std_dev_2 is None or std_dev_2 > 0)
+        )
+    return metric_ok and 0 < alpha < 1 and 0 < power < 1 and sides in _VALID_SIDES and ratio > 0
+
+
+def _target_rate(baseline: float, mde: float, mde_type: str) -> float:
+    """Treatment rate implied by the baseline and MDE."""
+    if mde_type == 'relative':
+        return baseline * (1 + mde)
+    return baseline + mde
+
+
 def validate_inputs(
     baseline: float,
     mde: float,
@@ -25,13 +69,32 @@ def validate_inputs(
     n_treatments: int,
     sides: int,
     weights: Optional[List[float]],
-) -> None:
+) -> Optional[np.ndarray]:
     """
     Validate all input parameters before calculation.
 
+    Returns:
+        The weights as a float array (None if no weights were given), so the
+        caller does not have to convert them again.
+
     Raises:
         ValidationError: If any parameter is invalid.
     """
+    # Fast path for the common valid, unweighted call
+    if (
+        weights is None
+        and _shared_inputs_ok(alpha, power, sides, ratio, metric_type, baseline, std_dev, std_dev_2)
+        and mde != 0
+        and mde_type in _VALID_MDE_TYPES
+        and test_type in _VALID_TEST_TYPES
+        and not (test_type == 'chi2' and metric_type == 'mean')
+        and (metric_type != 'proportion' or 0 < _target_rate(baseline, mde, mde_type) < 1)
+        and n_controls >= 1 and n_treatments >= 1
+        and (n_comparisons is None or n_comparisons >= 1)
+        and (correction is None or correction.lower() in _VALID_CORRECTIONS)
+    ):
+        return None
+
     errors = []
 
     # Alpha validation
@@ -43,19 +106,19 @@ def validate_inputs(
         errors.append(f"power must be between 0 and 1, got {power}")
 
     # Sides validation
-    if sides not in (1, 2):
+    if sides not in _VALID_SIDES:
         errors.append(f"sides must be 1 or 2, got {sides}")
 
     # Metric type validation
-    if metric_type not in ('proportion', 'mean'):
+    if metric_type not in _VALID_METRIC_TYPES:
         errors.append(f"metric_type must be 'proportion' or 'mean', got '{metric_type}'")
 
     # MDE type validation
-    if mde_type not in ('relative', 'absolute'):
+    if mde_type not in _VALID_MDE_TYPES:
         errors.append(f"mde_type must be 'relative' or 'absolute', got '{mde_type}'")
 
     # Test type validation
-    if test_type not in ('z', 't', 'chi2'):
+    if test_type not in _VALID_TEST_TYPES:
         errors.append(f"test_type must be 'z', 't', or 'chi2', got '{test_type}'")
 
     # Chi-square only for proportions
@@ -73,11 +136,7 @@ def validate_inputs(
 
     # Calculate target rate for proportions to validate bounds
     if metric_type == 'proportion' and not errors:
-        if mde_type == 'relative':
-            target = baseline * (1 + mde)
-        else:
-            target = baseline + mde
-
+        target = _target_rate(baseline, mde, mde_type)
         if not (0 < target < 1):
             errors.append(f"Target rate {target:.4f} is out of bounds (0, 1). Check your MDE value.")
 
@@ -107,25 +166,30 @@ def validate_inputs(
         errors.append(f"n_comparisons must be at least 1, got {n_comparisons}")
 
     # Correction validation
-    if correction is not None and correction.lower() not in ('bonferroni', 'sidak'):
+    if correction is not None and correction.lower() not in _VALID_CORRECTIONS:
         errors.append(f"correction must be 'bonferroni', 'sidak', or None, got '{correction}'")
 
     # Weights validation
+    weights_array = None
     if weights is not None:
+        weights_array = np.asarray(weights, dtype=np.float64)
+
         expected_len = n_controls + n_treatments
-        if len(weights) != expected_len:
+        if weights_array.size != expected_len:
             errors.append(
-                f"weights length ({len(weights)}) must match "
+                f"weights length ({weights_array.size}) must match "
                 f"n_controls + n_treatments ({expected_len})"
             )
 
-        if any(w <= 0 for w in weights):
+        if (weights_array <= 0).any():
             errors.append("All weights must be positive")
 
     # Raise all errors at once
     if errors:
         raise ValidationError("\n".join(errors))
 
+    return weights_array
+
 
 def validate_mde_inputs(
     baseline: float,
@@ -145,6 +209,14 @@ def validate_mde_inputs(
     Raises:
         ValidationError: If any parameter is invalid.
     """
+    # Fast path for the common valid call
+    if (
+        _shared_inputs_ok(alpha, power, sides, ratio, metric_type, baseline, std_dev, std_dev_2)
+        and test_type in _VALID_MDE_TEST_TYPES
+        and sample_size_per_group >= 1
+    ):
+        return
+
     errors = []
 
     # Alpha validation
@@ -156,15 +228,15 @@ def validate_mde_inputs(
         errors.append(f"power must be between 0 and 1, got {power}")
 
     # Sides validation
-    if sides not in (1, 2):
+    if sides not in _VALID_SIDES:
         errors.append(f"sides must be 1 or 2, got {sides}")
 
     # Metric type validation
-    if metric_type not in ('proportion', 'mean'):
+    if metric_type not in _VALID_METRIC_TYPES:
         errors.append(f"metric_type must be 'proportion' or 'mean', got '{metric_type}'")
 
     # Test type validation
-    if test_type not in ('z', 't'):
+    if test_type not in _VALID_MDE_TEST_TYPES:
         errors.append(f"test_type must be 'z' or 't', got '{test_type}'")
 
     # Baseline validation for proportions
@@ -193,3 +265,105 @@ def validate_mde_inputs(
     # Raise all errors at once
     if errors:
         raise ValidationError("\n".join(errors))
+
+
+def validate_batch_inputs(
+    baseline: np.ndarray,
+    mde: np.ndarray,
+    power: np.ndarray,
+    alpha: np.ndarray,
+    mde_type: str,
+    ratio: float,
+    metric_type: str,
+    std_dev: Optional[float],
+    std_dev_2: Optional[float],
+    test_type: str,
+    n_comparisons: int,
+    correction: Optional[str],
+    sides: int,
+) -> None:
+    """
+    Validate broadcast input arrays for batch sample size calculation.
+
+    Each bound is checked once over the whole grid; messages report how many
+    grid points fail it.
+
+    Raises:
+        ValidationError: If any parameter is invalid.
+    """
+    errors = []
+
+    def outside_unit(values: np.ndarray) -> int:
+        """Number of grid points not strictly between 0 and 1."""
+        return int(np.count_nonzero(~((0 < values) & (values < 1))))
+
+    # Alpha and power validation
+    n_bad = outside_unit(alpha)
+    if n_bad:
+        errors.append(f"alpha must be between 0 and 1 ({n_bad} values out of range)")
+
+    n_bad = outside_unit(power)
+    if n_bad:
+        errors.append(f"power must be between 0 and 1 ({n_bad} values out of range)")
+
+    # Categorical parameters
+    if sides not in _VALID_SIDES:
+        errors.append(f"sides must be 1 or 2, got {sides}")
+
+    if metric_type not in _VALID_METRIC_TYPES:
+        errors.append(f"metric_type must be 'proportion' or 'mean', got '{metric_type}'")
+
+    if mde_type not in _VALID_MDE_TYPES:
+        errors.append(f"mde_type must be 'relative' or 'absolute', got '{mde_type}'")
+
+    if test_type not in _VALID_TEST_TYPES:
+        errors.append(f"test_type must be 'z', 't', or 'chi2', got '{test_type}'")
+
+    if test_type == 'chi2' and metric_type == 'mean':
+        errors.append("Chi-square test is only valid for proportions, not means. Use 'z' or 't' instead.")
+
+    # Baseline validation for proportions
+    if metric_type == 'proportion':
+        n_bad = outside_unit(baseline)
+        if n_bad:
+            errors.append(
+                f"For proportions, baseline must be between 0 and 1 ({n_bad} values out of range)"
+            )
+
+    # MDE validation
+    n_bad = int(np.count_nonzero(mde == 0))
+    if n_bad:
+        errors.append(f"mde cannot be zero ({n_bad} values)")
+
+    # Target rate bounds for proportions
+    if metric_type == 'proportion' and not errors:
+        n_bad = outside_unit(_target_rate(baseline, mde, mde_type))
+        if n_bad:
+            errors.append(
+                f"Target rate is out of bounds (0, 1) for {n_bad} values. Check your MDE values."
+            )
+
+    # Ratio validation
+    if ratio <= 0:
+        errors.append(f"ratio must be positive, got {ratio}")
+
+    # Standard deviation validation for means
+    if metric_type == 'mean':
+        if std_dev is None:
+            errors.append("std_dev is required for metric_type='mean'")
+        elif std_dev <= 0:
+            errors.append(f"std_dev must be positive, got {std_dev}")
+
+        if std_dev_2 is not None and std_dev_2 <= 0:
+            errors.append(f"std_dev_2 must be positive, got {std_dev_2}")
+
+    # Comparisons and correction
+    if n_comparisons < 1:
+        errors.append(f"n_comparisons must be at least 1, got {n_comparisons}")
+
+    if correction is not None and correction.lower() not in _VALID_CORRECTIONS:
+        errors.append(f"correction must be 'bonferroni', 'sidak', or None, got '{correction}'")
+
+    # Raise all errors at once
+    if errors:
+        raise ValidationError("\n".join(errors))
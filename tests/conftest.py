@@ -0,0 +1,86 @@
+"""Shared fixtures for the A/B test calculator test suite."""
+
+import pytest
+
+from ab_test_calc import calculate_mde_for_sample, calculate_sample_size
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Collect tests marked slow first.
+
+    Under xdist's default load distribution, tests go out to workers in
+    collection order, so slow tests are handed out early rather than last.
+    """
+    items.sort(key=lambda item: item.get_closest_marker("slow") is None)
+
+
+@pytest.fixture(scope="session")
+def calc():
+    """
+    calculate_sample_size, shared by the whole session.
+
+    The function memoizes its own results, so tests repeating the same
+    arguments reuse one computation. The cache is emptied once here so the
+    session never depends on state from an earlier import.
+    """
+    calculate_sample_size.cache_clear()
+    return calculate_sample_size
+
+
+@pytest.fixture(scope="session")
+def baseline_ss_result(calc):
+    """Standard 10% baseline, 2pp MDE result for tests that inspect its shape."""
+    return calc(baseline=0.1, mde=0.02)
+
+
+@pytest.fixture(scope="session")
+def baseline_mde_result():
+    """MDE result for a 10% baseline with 5000 per group."""
+    return calculate_mde_for_sample(baseline=0.10, sample_size_per_group=5000)
+
+
+# Standard normal quantiles for the alpha/power settings used across the
+# suite, as textbook constants so tests can check them without scipy.
+Z_TABLE = {
+    (0.05, 1): 1.644854,
+    (0.05, 2): 1.959964,
+    (0.01, 1): 2.326348,
+    (0.01, 2): 2.575829,
+    (0.025, 1): 1.959964,
+    (0.025, 2): 2.241403,
+}
+
+BETA_TABLE = {
+    0.8: 0.841621,
+    0.9: 1.281552,
+    0.99: 2.326348,
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_quantile_cache():
+    """
+    Fill the core quantile caches for the suite's alpha/power settings.
+
+    Pays the first scipy.special calls once at session start, so individual
+    tests measure the calculation rather than cold lookups.
+    """
+    from ab_test_calc.core import _z_alpha, _z_beta
+
+    for alpha, sides in Z_TABLE:
+        _z_alpha(alpha, sides)
+    for power in BETA_TABLE:
+        _z_beta(power)
+
+
+@pytest.fixture(scope="session")
+def z_table():
+    """Reference z critical values keyed by (alpha, sides)."""
+    return Z_TABLE
+
+
+@pytest.fixture(scope="session")
+def beta_table():
+    """Reference z quantiles for power, keyed by power."""
+    return BETA_TABLE